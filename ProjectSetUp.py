@@ -10,48 +10,113 @@ bl_info = {
 
 import bpy
 import os
+import sys
 import subprocess
 import shutil
+import functools
+import operator
 from pathlib import Path
 
-DEFAULT_FOLDER_NAMES = ["Blender", "Geo", "Painter", "Photoshop", "References", "Renders", "Textures"]
+DEFAULT_FOLDER_NAMES = ("Blender", "Geo", "Painter", "Photoshop", "References", "Renders", "Textures")
 
-# Define a custom property to store the list of folders
-bpy.types.Scene.folder_list = bpy.props.CollectionProperty(type=bpy.types.PropertyGroup)
 
-# Define a property to store the active folder index
-bpy.types.Scene.active_folder_index = bpy.props.IntProperty()
+# Parse a comma-separated list of folder names, skipping empty and duplicate entries
+@functools.lru_cache(maxsize=4)
+def _parse_folder_names(names):
+    return tuple(dict.fromkeys(name.strip() for name in names.split(',') if name.strip()))
 
-# Define a property to store the directory path
-bpy.types.Scene.directory_path = bpy.props.StringProperty(
-    name="Directory Path",
-    subtype='DIR_PATH',
-    default="",
-    description="Choose a directory path"
-)
 
-# Define a property to store the file path of the .Pur
-bpy.types.Scene.pure_ref_path = bpy.props.StringProperty(
-    name="pure_ref_path",
-    description="File path of the .pur",
-    default="",
-    subtype='FILE_PATH'
-)
+# Reduce folder names (which may contain sub-paths such as "Textures/Diffuse")
+# to the deepest paths only, so a single os.makedirs call creates each branch
+def _leaf_folders(names):
+    paths = sorted({os.path.normpath(name) for name in names if name},
+                   key=lambda path: path.count(os.sep), reverse=True)
+    ancestors = set()
+    leaves = []
+    for path in paths:
+        if path in ancestors:
+            continue
+        leaves.append(path)
+        parent = os.path.dirname(path)
+        while parent and parent not in ancestors:
+            ancestors.add(parent)
+            parent = os.path.dirname(parent)
+    return leaves
 
-#Define a property to store name of .blend file
-bpy.types.Scene.blend_name = bpy.props.StringProperty(
-    name="Blend Name",
-    subtype='FILE_NAME',
-    default="",
-    description="Set the name of the .blend file"
-)
 
-# Define a property to store custom folder names
-bpy.types.Scene.custom_folder_names = bpy.props.StringProperty(
-    name="Custom Folder Names",
-    description="Enter custom folder names as a comma-separated list",
-    default=""
-)
+# Resolve a Blender path (which may be relative to the .blend file) to an
+# absolute path. Results are cached per path and .blend file location.
+def _abspath(path):
+    return _cached_abspath(path, bpy.data.filepath)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_abspath(path, blend_filepath):
+    return os.path.abspath(bpy.path.abspath(path))
+
+
+# Remove a folder, skipping the recursive walk of shutil.rmtree when it is empty
+def _remove_folder(path):
+    with os.scandir(path) as entries:
+        empty = next(entries, None) is None
+    if empty:
+        os.rmdir(path)
+    else:
+        shutil.rmtree(path)
+
+
+# Look up this add-on's preferences
+def _prefs(context):
+    return context.preferences.addons[__name__].preferences
+
+
+# Scene properties are registered with the add-on rather than at import time
+def _register_props():
+    # Define a custom property to store the list of folders
+    bpy.types.Scene.folder_list = bpy.props.CollectionProperty(type=bpy.types.PropertyGroup)
+
+    # Define a property to store the active folder index
+    bpy.types.Scene.active_folder_index = bpy.props.IntProperty()
+
+    # Define a property to store the directory path
+    bpy.types.Scene.directory_path = bpy.props.StringProperty(
+        name="Directory Path",
+        subtype='DIR_PATH',
+        default="",
+        description="Choose a directory path"
+    )
+
+    # Define a property to store the file path of the .Pur
+    bpy.types.Scene.pure_ref_path = bpy.props.StringProperty(
+        name="pure_ref_path",
+        description="File path of the .pur",
+        default="",
+        subtype='FILE_PATH'
+    )
+
+    #Define a property to store name of .blend file
+    bpy.types.Scene.blend_name = bpy.props.StringProperty(
+        name="Blend Name",
+        subtype='FILE_NAME',
+        default="",
+        description="Set the name of the .blend file"
+    )
+
+    # Define a property to store custom folder names
+    bpy.types.Scene.custom_folder_names = bpy.props.StringProperty(
+        name="Custom Folder Names",
+        description="Enter custom folder names as a comma-separated list",
+        default=""
+    )
+
+
+def _unregister_props():
+    del bpy.types.Scene.folder_list
+    del bpy.types.Scene.active_folder_index
+    del bpy.types.Scene.directory_path
+    del bpy.types.Scene.pure_ref_path
+    del bpy.types.Scene.blend_name
+    del bpy.types.Scene.custom_folder_names
 
 
 class OBJECT_OT_UpdateFolderPreferences(bpy.types.Operator):
@@ -61,9 +126,10 @@ class OBJECT_OT_UpdateFolderPreferences(bpy.types.Operator):
     bl_options = {"REGISTER", "UNDO"}
 
     def execute(self, context):
-        prefs = context.preferences.addons[__name__].preferences
+        prefs = _prefs(context)
         # Save the custom folder names to preferences
         prefs.default_folder_names = context.scene.custom_folder_names
+        _parse_folder_names.cache_clear()
         self.report({'INFO'}, "Folder preferences updated.")
         return {'FINISHED'}
 
@@ -73,20 +139,17 @@ class OBJECT_OT_AddDefaultFolder(bpy.types.Operator):
     bl_idname = "scene.add_default_folder"
     bl_label = "Add Default Folders"
     bl_description = "Add the default folders"
-    bl_options = {"REGISTER", "UNDO"}
+    bl_options = {"REGISTER"}
 
     def execute(self, context):
         scene = context.scene
-        prefs = context.preferences.addons[__name__].preferences
+        prefs = _prefs(context)
 
         # Clear existing folders in the scene
         scene.folder_list.clear()
 
-        # Get default folder names from preferences
-        default_folder_names = [name.strip() for name in prefs.default_folder_names.split(',')]
-
-        # Add default folders
-        for name in default_folder_names:
+        # Add default folders from preferences, falling back to the built-in defaults
+        for name in _parse_folder_names(prefs.default_folder_names) or DEFAULT_FOLDER_NAMES:
             folder = scene.folder_list.add()
             folder.name = name
 
@@ -99,7 +162,7 @@ class OBJECT_OT_AddNewFolder(bpy.types.Operator):
     bl_idname = "scene.add_new_folder"
     bl_label = "Add Folder"
     bl_description = "Add a new folders"
-    bl_options = {"REGISTER", "UNDO"}
+    bl_options = {"REGISTER"}
 
     def execute(self, context):
         scene = context.scene
@@ -111,7 +174,7 @@ class OBJECT_OT_RemoveFolder(bpy.types.Operator):
     bl_idname = "scene.remove_folder"
     bl_label = "Remove Folder"
     bl_description = "Remove selected folder"
-    bl_options = {"REGISTER", "UNDO"}
+    bl_options = {"REGISTER"}
 
     confirm: bpy.props.BoolProperty(default=False)
 
@@ -123,7 +186,7 @@ class OBJECT_OT_RemoveFolder(bpy.types.Operator):
             return {'CANCELLED'}
 
         folder_name = scene.folder_list[folder_index].name
-        directory_path = Path(scene.directory_path).resolve()
+        directory_path = Path(_abspath(scene.directory_path))
         folder_path = directory_path / folder_name
 
         if folder_path.exists() and not self.confirm:
@@ -172,7 +235,7 @@ class OBJECT_OT_CreateProject(bpy.types.Operator):
 
     def execute(self, context):
         scene = context.scene
-        directory_path = Path(scene.directory_path).resolve()
+        directory_path = Path(_abspath(scene.directory_path))
 
         if not os.path.exists(directory_path):
             self.report({'ERROR'}, "Directory does not exist.")
@@ -186,13 +249,16 @@ class OBJECT_OT_CreateProject(bpy.types.Operator):
             return {'CANCELLED'}
 
         # Get folder names from the scene's folder_list
-        folder_names = [folder.name for folder in scene.folder_list]
+        folder_names = list(map(operator.attrgetter('name'), scene.folder_list))
 
-        for name in folder_names:
-            folder_path = directory_path / name
+        # Build folder paths from the absolute base string instead of a Path per folder
+        base = str(directory_path)
+        sep = os.sep
+        for name in _leaf_folders(folder_names):
+            folder_path = base + sep + name
             try:
                 os.makedirs(folder_path, exist_ok=True)
-            except Exception as e:
+            except OSError as e:
                 self.report({'ERROR'}, f"Error creating folder: {str(e)}")
                 return {'CANCELLED'}
 
@@ -231,13 +297,9 @@ class OBJECT_OT_SetBlendFile(bpy.types.Operator):
         scene = context.scene
 
         # Get the directory path and blend file name
-        directory_path = Path(scene.directory_path).resolve()
+        directory_path = Path(_abspath(scene.directory_path))
         blend_name = scene.blend_name
 
-        # Ensure the directory path ends with a slash
-        if not directory_path.as_posix().endswith('/'):
-            directory_path /= ''  # This ensures that the path ends with a separator
-
         # Construct the path to the Blender folder
         blender_folder_path = directory_path / "Blender"
 
@@ -263,32 +325,35 @@ class OBJECT_OT_UpdateProject(bpy.types.Operator):
 
     def execute(self, context):
         scene = context.scene
-        directory_path = Path(scene.directory_path).resolve()
+        directory_path = Path(_abspath(scene.directory_path))
 
         if not os.path.exists(directory_path):
             self.report({'ERROR'}, "Directory does not exist.")
             return {'CANCELLED'}
 
         # Gather current Blender folder names
-        blender_folder_names = {folder.name for folder in scene.folder_list}
+        blender_folder_names = set(map(operator.attrgetter('name'), scene.folder_list))
 
-        # Check folders in the directory
-        existing_folders = set(os.listdir(directory_path))
+        # Check folders in the directory, ignoring plain files
+        with os.scandir(directory_path) as entries:
+            existing_folders = {entry.name for entry in entries if entry.is_dir()}
 
         # Folders to be added and removed
+        # Keep the top-level folder of any sub-path in the list
+        kept_folders = {Path(name).parts[0] for name in blender_folder_names if name}
         folders_to_add = blender_folder_names - existing_folders
-        folders_to_remove = existing_folders - blender_folder_names
+        folders_to_remove = existing_folders - kept_folders
 
         try:
             # Add new folders
-            for folder_name in folders_to_add:
+            for folder_name in _leaf_folders(folders_to_add):
                 folder_path = directory_path / folder_name
-                os.mkdir(folder_path)
+                os.makedirs(folder_path, exist_ok=True)
 
             # Remove folders
             for folder_name in folders_to_remove:
                 folder_path = directory_path / folder_name
-                shutil.rmtree(folder_path)
+                _remove_folder(folder_path)
 
             self.report({'INFO'}, "Project folders updated successfully.")
             return {'FINISHED'}
@@ -299,14 +364,11 @@ class OBJECT_OT_UpdateProject(bpy.types.Operator):
             self.report({'ERROR'}, f"Error updating project folders: {str(e)}")
             return {'CANCELLED'}
 
-        self.report({'INFO'}, "Project folders updated successfully.")
-        return {'FINISHED'}
-
 class OBJECT_OT_OpenPureRef(bpy.types.Operator):
     bl_idname = "rockhelper.open_pureref"
     bl_label = "Open PureRef Board"
     bl_description = "Open the specified PureRef project file"
-    bl_options = {"REGISTER", "UNDO"}
+    bl_options = {"REGISTER"}
 
     def execute(self, context):
         pure_ref_path = context.scene.pure_ref_path
@@ -317,8 +379,13 @@ class OBJECT_OT_OpenPureRef(bpy.types.Operator):
                 absolute_path = bpy.path.abspath(pure_ref_path)
                 
                 if os.path.isfile(absolute_path):
-                    with open(absolute_path, 'rb') as file:
-                        subprocess.Popen([absolute_path], shell=True)
+                    # Open with the associated program without going through a shell
+                    if os.name == 'nt':
+                        os.startfile(absolute_path)
+                    elif sys.platform == 'darwin':
+                        subprocess.Popen(['open', absolute_path])
+                    else:
+                        subprocess.Popen(['xdg-open', absolute_path])
                 else:
                     self.report({'ERROR'}, f"PureRef project file not found: {absolute_path}")
             except Exception as e:
@@ -348,7 +415,7 @@ class ProjectSetUpPreferences(bpy.types.AddonPreferences):
     default_folder_names: bpy.props.StringProperty(
         name="Default Folder Names",
         description="Enter custom folder names as a comma-separated list",
-        default="Blender,Geo,Painter,Photoshop,References,Renders,Textures"
+        default=",".join(DEFAULT_FOLDER_NAMES)
     )
 
 
@@ -379,8 +446,8 @@ class VIEW3D_PT_project_setup_panel(bpy.types.Panel):
         box=layout.box()
 
         box.label(icon="FILE_FOLDER", text="Path:")
-        box.prop(context.scene, "directory_path", text="Project Folder")
-        box.prop(context.scene, "blend_name", text=".Blend Name")
+        box.prop(scene, "directory_path", text="Project Folder")
+        box.prop(scene, "blend_name", text=".Blend Name")
 
         box=layout.box()
 
@@ -407,7 +474,7 @@ class VIEW3D_PT_project_setup_panel(bpy.types.Panel):
         box=layout.box()
         box.label(icon="IMAGE_BACKGROUND", text="PureRef File:")
         # Add the PureRef file path
-        box.prop(context.scene, "pure_ref_path", text="")
+        box.prop(scene, "pure_ref_path", text="")
         # Add Open PureRef Board Button
         box.operator("rockhelper.open_pureref", icon="IMAGE_DATA", text="Open PureRef Board")
         
@@ -425,12 +492,15 @@ classes = (
     OBJECT_OT_OpenPureRef,
     OBJECT_OT_UpdateFolderPreferences,
 )
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    _register_classes()
+    _register_props()
+
 def unregister():
-    for cls in classes:
-        bpy.utils.unregister_class(cls)
+    _unregister_props()
+    _unregister_classes()
 
 if __name__ == "__main__":
     register()